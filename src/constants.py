@@ -13,3 +13,15 @@ UNKNOWN_COMMAND_TEMPLATE = 'Команда "{cmd}" не распознана. П
 INVALID_VALUE_TEMPLATE = "Недопустимое значение: {val}. Попробуйте снова."
 
 INFO_TABLE_HEADER = "***Информация о таблице***"
+
+# Параметры статистики и планировщика запросов
+MCV_LIMIT = 5
+DEFAULT_EQ_SELECTIVITY = 0.005
+DEFAULT_RANGE_SELECTIVITY = 0.333
+CPU_TUPLE_COST = 1.0
+INDEX_STEP_COST = 1.0
+ORDER_CHECK_COST = 0.15
+PARALLEL_SETUP_COST = 5000.0
+PARALLEL_SCAN_WORKERS = 4
+
+EXPLAIN_HEADER = "***План запроса***"
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import time
 from typing import Any
 
 from src.constants import VALID_TYPES
 from src.decorators import confirm_action, create_cacher, handle_db_errors, log_time
 
+from .planner import collect_stats, execute_plan, plan_query
 from .utils import load_table_data
 
 _cacher = create_cacher()
@@ -114,11 +116,40 @@ def insert(
     return data
 
 
-def _match_where(record: dict[str, Any], where: dict[str, Any]) -> bool:
-    for key, val in where.items():
-        if key not in record or record[key] != val:
-            return False
-    return True
+def _convert_where(
+    schema: list[tuple[str, str]],
+    where: dict[str, Any] | None,
+) -> dict[str, Any] | None:
+    """Convert where values to the types of their columns."""
+    if where is None:
+        return None
+    type_by_name = {name: t for name, t in schema}
+    converted: dict[str, Any] = {}
+    for col, condition in where.items():
+        if col not in type_by_name:
+            converted[col] = condition
+            continue
+        op, value = condition if isinstance(condition, tuple) else ("=", condition)
+        col_type = type_by_name[col]
+        try:
+            value = _convert_value(value, col_type)
+        except ValueError as exc:
+            raise ValueError(
+                f'Значение "{value}" не подходит для столбца {col}:{col_type}.',
+            ) from exc
+        converted[col] = value if op == "=" else (op, value)
+    return converted
+
+
+def _find_rows(
+    metadata: dict[str, Any],
+    table_name: str,
+    data: list[dict[str, Any]],
+    where: dict[str, Any] | None,
+) -> list[dict[str, Any]]:
+    plan = plan_query(metadata, table_name, where, data)
+    rows, _ = execute_plan(plan, data)
+    return rows
 
 
 @log_time
@@ -128,16 +159,18 @@ def select(
     table_name: str,
     where: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    _ = _get_schema(metadata, table_name)
+    schema = _get_schema(metadata, table_name)
 
     if where is None:
         return load_table_data(table_name)
 
+    where = _convert_where(schema, where)
+
     key = (table_name, frozenset(where.items()))
 
     def load() -> list[dict[str, Any]]:
         data = load_table_data(table_name)
-        return [row for row in data if _match_where(row, where)]
+        return _find_rows(metadata, table_name, data, where)
 
     return _cacher(key, load)
 
@@ -153,16 +186,16 @@ def update(
     """Update records matching where with new values from set_clause."""
     schema = _get_schema(metadata, table_name)
     type_by_name = {name: t for name, t in schema}
+    where = _convert_where(schema, where)
     data = load_table_data(table_name)
     updated_count = 0
-    for row in data:
-        if _match_where(row, where):
-            for col, raw_val in set_clause.items():
-                if col not in type_by_name:
-                    raise KeyError(col)
-                col_type = type_by_name[col]
-                row[col] = _convert_value(str(raw_val), col_type)
-            updated_count += 1
+    for row in _find_rows(metadata, table_name, data, where):
+        for col, raw_val in set_clause.items():
+            if col not in type_by_name:
+                raise KeyError(col)
+            col_type = type_by_name[col]
+            row[col] = _convert_value(str(raw_val), col_type)
+        updated_count += 1
     print(
         f'Обновлено записей в таблице "{table_name}": {updated_count}.',
     )
@@ -178,9 +211,12 @@ def delete(
     where: dict[str, Any],
 ) -> list[dict[str, Any]]:
     """Delete records matching where from table."""
-    _ = _get_schema(metadata, table_name)
+    schema = _get_schema(metadata, table_name)
+    where = _convert_where(schema, where)
     data = load_table_data(table_name)
-    new_data = [row for row in data if not _match_where(row, where)]
+    # ID может повторяться после update, поэтому сравниваем сами записи
+    matched = {id(row) for row in _find_rows(metadata, table_name, data, where)}
+    new_data = [row for row in data if id(row) not in matched]
     removed = len(data) - len(new_data)
     print(
         f'Удалено записей из таблицы "{table_name}": {removed}.',
@@ -194,3 +230,66 @@ def info(metadata: dict[str, Any], table_name: str) -> dict[str, Any]:
     schema = _get_schema(metadata, table_name)
     data = load_table_data(table_name)
     return {"columns": schema, "rows": len(data)}
+
+
+@log_time
+@handle_db_errors
+def analyze(metadata: dict[str, Any], table_name: str) -> dict[str, Any]:
+    """Collect column statistics for the planner and store them in metadata."""
+    schema = _get_schema(metadata, table_name)
+    data = load_table_data(table_name)
+    metadata[table_name]["stats"] = collect_stats(schema, data)
+    print(
+        f'Статистика таблицы "{table_name}" собрана: {len(data)} записей.',
+    )
+    return metadata
+
+
+@handle_db_errors
+def explain(
+    metadata: dict[str, Any],
+    table_name: str,
+    where: dict[str, Any] | None = None,
+    analyze_run: bool = False,
+) -> dict[str, Any]:
+    """Build query plan and, if analyze_run is set, measure its actual execution."""
+    schema = _get_schema(metadata, table_name)
+    where = _convert_where(schema, where)
+    start = time.monotonic()
+    data = load_table_data(table_name)
+    load_time = time.monotonic() - start
+    plan = plan_query(metadata, table_name, where, data)
+    operators: list[dict[str, Any]] = [
+        {
+            "operator": "load",
+            "est_scanned": float(len(data)),
+            "est_rows": float(len(data)),
+        },
+    ]
+    order_check = plan["order_check"]
+    if order_check is not None:
+        operators.append(
+            {
+                "operator": "order_check",
+                "est_scanned": float(len(data)),
+                "est_rows": float(len(data)),
+            },
+        )
+    operators.append(
+        {
+            "operator": plan["operator"],
+            "est_scanned": plan["est_scanned"],
+            "est_rows": plan["est_rows"],
+        },
+    )
+    if analyze_run:
+        _, profile = execute_plan(plan, data)
+        operators[0].update(
+            {"scanned": len(data), "rows": len(data), "time": load_time},
+        )
+        if order_check is not None:
+            operators[1].update(
+                {key: order_check[key] for key in ("scanned", "rows", "time")},
+            )
+        operators[-1].update(profile)
+    return {"plan": plan, "operators": operators}
@@ -5,6 +5,7 @@ from typing import Any
 from prettytable import PrettyTable
 
 from src.constants import (
+    EXPLAIN_HEADER,
     HELP_HEADER_DATA,
     HELP_HEADER_TABLES,
     INVALID_VALUE_TEMPLATE,
@@ -16,11 +17,14 @@ from src.constants import (
 from . import core
 from .parser import (
     parse_create_table,
+    parse_delete,
+    parse_explain,
     parse_insert,
-    parse_set,
-    parse_where,
+    parse_select,
+    parse_update,
     split_command,
 )
+from .planner import format_condition
 from .utils import load_metadata, save_metadata, save_table_data
 
 
@@ -57,6 +61,11 @@ def print_help_data() -> None:
     )
     print("  info <имя>                                      - информация о таблице")
     print()
+    print("Планировщик запросов:")
+    print("  analyze <имя>                    - собрать статистику по столбцам")
+    print("  explain [analyze] <запрос>       - показать план select/update/delete")
+    print("  операторы where: =, <, <=, >, >=")
+    print()
     print("Общие команды:")
     print("  help    - справка")
     print("  exit    - выход")
@@ -83,6 +92,44 @@ def _print_select_result(rows: list[dict[str, Any]]) -> None:
     print(table)
 
 
+def _print_explain_result(report: dict[str, Any], analyze_run: bool) -> None:
+    plan = report["plan"]
+    print()
+    print(EXPLAIN_HEADER)
+    print(f"Таблица: {plan['table']}, записей: {plan['rows']}")
+    if not plan["analyzed"]:
+        print("Статистика не собрана, оценки приблизительные (выполните analyze).")
+    details = []
+    if plan["condition"] is not None:
+        details.append(format_condition(plan["column"], plan["condition"]))
+    if plan["filter"]:
+        details.append(
+            "фильтр: "
+            + " and ".join(
+                format_condition(col, cond) for col, cond in plan["filter"].items()
+            ),
+        )
+    if plan["order_check"] is not None and not plan["order_check"]["in_order"]:
+        details.append("записи не упорядочены по ID, индекс не используется")
+    if plan["workers"] > 1:
+        details.append(f"потоков: {plan['workers']}")
+    table = PrettyTable()
+    field_names = ["Оператор", "Оценка просмотра", "Оценка строк"]
+    if analyze_run:
+        field_names += ["Просмотрено", "Строк", "Время, сек."]
+    table.field_names = field_names
+    for op in report["operators"]:
+        row = [op["operator"], f"{op['est_scanned']:.1f}", f"{op['est_rows']:.1f}"]
+        if analyze_run:
+            row += [op["scanned"], op["rows"], f"{op['time']:.6f}"]
+        table.add_row(row)
+    print(table)
+    if details:
+        print("Условия: " + "; ".join(details))
+    print(f"Стоимость плана: {plan['cost']:.1f}")
+    print()
+
+
 def _handle_info(metadata: dict[str, Any], tokens: list[str]) -> None:
     if len(tokens) != 2:
         raise ValueError("Ожидалось: info <имя_таблицы>.")
@@ -159,60 +206,36 @@ def run() -> None:
                     save_table_data(table_name, data)
 
             elif cmd == "select":
-                if len(tokens) < 3 or tokens[1].lower() != "from":
-                    raise ValueError(
-                        "Ожидалось: select from <таблица> [where колонка = значение].",
-                    )
-                table_name = tokens[2]
-                where = None
-                if len(tokens) > 3:
-                    # ищем where
-                    if tokens[3].lower() != "where":
-                        raise ValueError(
-                            "Ожидалось ключевое слово where после имени таблицы.",
-                        )
-                    where = parse_where(tokens[4:])
-                rows = core.select(metadata, table_name, where) or []
-                _print_select_result(rows)
+                table_name, where = parse_select(tokens)
+                rows = core.select(metadata, table_name, where)
+                if rows is not None:
+                    _print_select_result(rows)
 
             elif cmd == "update":
-                # update <table> set ... where ...
-                if len(tokens) < 6 or tokens[2].lower() != "set":
-                    raise ValueError(
-                        "Ожидалось: update <таблица> set кол=знач where кол=знач.",
-                    )
-                table_name = tokens[1]
-                if "where" not in [t.lower() for t in tokens]:
-                    raise ValueError("Ожидалось условие where.")
-                where_index = next(
-                    i for i, t in enumerate(tokens) if t.lower() == "where"
-                )
-                set_tokens = tokens[3:where_index]
-                where_tokens = tokens[where_index + 1 :]
-                set_clause = parse_set(set_tokens)
-                where_clause = parse_where(where_tokens)
+                table_name, set_clause, where_clause = parse_update(tokens)
                 data = core.update(metadata, table_name, set_clause, where_clause)
                 if data is not None:
                     save_table_data(table_name, data)
 
             elif cmd == "delete":
-                # delete from <table> where ...
-                if len(tokens) < 5 or tokens[1].lower() != "from":
-                    raise ValueError(
-                        "Ожидалось: delete from <таблица> where кол=знач.",
-                    )
-                if "where" not in [t.lower() for t in tokens]:
-                    raise ValueError("Ожидалось условие where.")
-                table_name = tokens[2]
-                where_index = next(
-                    i for i, t in enumerate(tokens) if t.lower() == "where"
-                )
-                where_tokens = tokens[where_index + 1 :]
-                where_clause = parse_where(where_tokens)
+                table_name, where_clause = parse_delete(tokens)
                 data = core.delete(metadata, table_name, where_clause)
                 if data is not None:
                     save_table_data(table_name, data)
 
+            elif cmd == "analyze":
+                if len(tokens) != 2:
+                    raise ValueError("Ожидалось: analyze <имя_таблицы>.")
+                new_meta = core.analyze(metadata, tokens[1])
+                if new_meta is not None:
+                    save_metadata(META_FILE, new_meta)
+
+            elif cmd == "explain":
+                analyze_run, table_name, where = parse_explain(tokens)
+                report = core.explain(metadata, table_name, where, analyze_run)
+                if report is not None:
+                    _print_explain_result(report, analyze_run)
+
             elif cmd == "info":
                 _handle_info(metadata, tokens)
 
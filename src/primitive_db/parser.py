@@ -3,6 +3,8 @@ from __future__ import annotations
 import shlex
 from typing import Any
 
+WHERE_OPERATORS = ("=", "<", "<=", ">", ">=")
+
 
 def split_command(line: str) -> list[str]:
     """Split user input into tokens."""
@@ -19,19 +21,6 @@ def parse_create_table(args: list[str]) -> tuple[str, list[str]]:
     return table_name, columns_spec
 
 
-def _parse_literal(value: str) -> Any:
-    """Convert string literal to Python type according to simple rules."""
-    lower = value.lower()
-    if lower == "true":
-        return True
-    if lower == "false":
-        return False
-    if value.isdigit() or (value.startswith("-") and value[1:].isdigit()):
-        return int(value)
-    # строковые значения считаем уже очищенными от кавычек
-    return value
-
-
 def parse_values_segment(segment: str) -> list[str]:
     """Parse '(v1, v2, ...)' into a list of raw string values."""
     if not (segment.startswith("(") and segment.endswith(")")):
@@ -68,21 +57,96 @@ def parse_insert(tokens: list[str]) -> tuple[str, list[str]]:
 
 
 def parse_where(tokens: list[str]) -> dict[str, Any]:
-    """Parse 'col = value' tokens into dict."""
+    """Parse 'col <op> value' tokens into dict.
+
+    Equality is stored as {col: value}, comparisons as {col: (op, value)}.
+    Values stay raw strings; core converts them using the column type.
+    """
     if len(tokens) < 3:
         raise ValueError("Некорректное условие where.")
-    if tokens[1] != "=":
-        raise ValueError("Ожидался оператор '=' в where.")
+    op = tokens[1]
+    if op not in WHERE_OPERATORS:
+        raise ValueError(
+            f"Ожидался один из операторов {', '.join(WHERE_OPERATORS)} в where.",
+        )
     column = tokens[0]
     value_str = " ".join(tokens[2:])
     if (value_str.startswith('"') and value_str.endswith('"')) or (
         value_str.startswith("'") and value_str.endswith("'")
     ):
         value_str = value_str[1:-1]
-    value = _parse_literal(value_str)
-    return {column: value}
+    if op == "=":
+        return {column: value_str}
+    return {column: (op, value_str)}
 
 
 def parse_set(tokens: list[str]) -> dict[str, Any]:
     """Parse 'col = value' for set clause."""
+    if len(tokens) > 1 and tokens[1] != "=":
+        raise ValueError("Ожидался оператор '=' в set.")
     return parse_where(tokens)
+
+
+def _where_index(tokens: list[str]) -> int:
+    if "where" not in [t.lower() for t in tokens]:
+        raise ValueError("Ожидалось условие where.")
+    return next(i for i, t in enumerate(tokens) if t.lower() == "where")
+
+
+def parse_select(tokens: list[str]) -> tuple[str, dict[str, Any] | None]:
+    """Parse: select from <table> [where <condition>]"""
+    if len(tokens) < 3 or tokens[1].lower() != "from":
+        raise ValueError(
+            "Ожидалось: select from <таблица> [where колонка = значение].",
+        )
+    table_name = tokens[2]
+    if len(tokens) == 3:
+        return table_name, None
+    if tokens[3].lower() != "where":
+        raise ValueError(
+            "Ожидалось ключевое слово where после имени таблицы.",
+        )
+    return table_name, parse_where(tokens[4:])
+
+
+def parse_update(tokens: list[str]) -> tuple[str, dict[str, Any], dict[str, Any]]:
+    """Parse: update <table> set <col = value> where <condition>"""
+    if len(tokens) < 6 or tokens[2].lower() != "set":
+        raise ValueError(
+            "Ожидалось: update <таблица> set кол=знач where кол=знач.",
+        )
+    table_name = tokens[1]
+    where_index = _where_index(tokens)
+    set_clause = parse_set(tokens[3:where_index])
+    where_clause = parse_where(tokens[where_index + 1 :])
+    return table_name, set_clause, where_clause
+
+
+def parse_delete(tokens: list[str]) -> tuple[str, dict[str, Any]]:
+    """Parse: delete from <table> where <condition>"""
+    if len(tokens) < 5 or tokens[1].lower() != "from":
+        raise ValueError(
+            "Ожидалось: delete from <таблица> where кол=знач.",
+        )
+    where_index = _where_index(tokens)
+    return tokens[2], parse_where(tokens[where_index + 1 :])
+
+
+def parse_explain(tokens: list[str]) -> tuple[bool, str, dict[str, Any] | None]:
+    """Parse: explain [analyze] <select|update|delete query>"""
+    query = tokens[1:]
+    analyze_run = bool(query) and query[0].lower() == "analyze"
+    if analyze_run:
+        query = query[1:]
+    if not query:
+        raise ValueError("Ожидалось: explain [analyze] <запрос>.")
+    cmd = query[0].lower()
+    if cmd == "select":
+        table_name, where = parse_select(query)
+    elif cmd == "update":
+        table_name, _, where = parse_update(query)
+    elif cmd == "delete":
+        table_name, where = parse_delete(query)
+    else:
+        raise ValueError("explain поддерживает только select, update и delete.")
+    return analyze_run, table_name, where
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import math
+import operator
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from typing import Any
+
+from src.constants import (
+    CPU_TUPLE_COST,
+    DEFAULT_EQ_SELECTIVITY,
+    DEFAULT_RANGE_SELECTIVITY,
+    INDEX_STEP_COST,
+    MCV_LIMIT,
+    ORDER_CHECK_COST,
+    PARALLEL_SCAN_WORKERS,
+    PARALLEL_SETUP_COST,
+)
+
+# ID служит кластерным индексом только тогда, когда _index_values
+# подтверждает, что записи в файле таблицы идут по возрастанию ID.
+INDEX_COLUMN = "ID"
+
+# Проверка условий where выполняется на чистом Python и держит GIL, поэтому
+# потоки ускоряют просмотр только в сборке интерпретатора без GIL.
+_PARALLEL_SPEEDUP = (
+    1 if getattr(sys, "_is_gil_enabled", lambda: True)() else PARALLEL_SCAN_WORKERS
+)
+
+COMPARATORS = {
+    "=": operator.eq,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _split_condition(condition: Any) -> tuple[str, Any]:
+    if isinstance(condition, tuple):
+        return condition
+    return "=", condition
+
+
+def format_condition(column: str, condition: Any) -> str:
+    """Return human readable form of a single where condition."""
+    op, value = _split_condition(condition)
+    return f"{column} {op} {value!r}"
+
+
+def match_where(record: dict[str, Any], where: dict[str, Any]) -> bool:
+    """Check that record satisfies every condition of where."""
+    for key, condition in where.items():
+        if key not in record:
+            return False
+        op, value = _split_condition(condition)
+        if not COMPARATORS[op](record[key], value):
+            return False
+    return True
+
+
+def collect_stats(
+    schema: list[tuple[str, str]],
+    data: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Collect row count and per-column distribution statistics."""
+    columns: dict[str, Any] = {}
+    for col_name, _ in schema:
+        values = [row[col_name] for row in data if col_name in row]
+        counts = Counter(values)
+        columns[col_name] = {
+            "distinct": len(counts),
+            "min": min(values) if values else None,
+            "max": max(values) if values else None,
+            "mcv": [[val, cnt] for val, cnt in counts.most_common(MCV_LIMIT)],
+        }
+    return {"rows": len(data), "columns": columns}
+
+
+def _eq_selectivity(col_stats: dict[str, Any], stats_rows: int, value: Any) -> float:
+    if stats_rows == 0:
+        return 0.0
+    mcv_total = 0
+    for mcv_value, count in col_stats["mcv"]:
+        if type(mcv_value) is type(value) and mcv_value == value:
+            return count / stats_rows
+        mcv_total += count
+    try:
+        if value < col_stats["min"] or value > col_stats["max"]:
+            return 0.0
+    except TypeError:
+        return DEFAULT_EQ_SELECTIVITY
+    rest_distinct = col_stats["distinct"] - len(col_stats["mcv"])
+    if rest_distinct <= 0:
+        return 0.0
+    return (1 - mcv_total / stats_rows) / rest_distinct
+
+
+def _range_selectivity(col_stats: dict[str, Any], op: str, value: Any) -> float:
+    low, high = col_stats["min"], col_stats["max"]
+    if low is None:
+        return 0.0
+    numeric = (int, float)
+    if not (isinstance(low, numeric) and isinstance(value, numeric)):
+        return DEFAULT_RANGE_SELECTIVITY
+    if high == low:
+        return 1.0 if COMPARATORS[op](low, value) else 0.0
+    below = min(max((value - low) / (high - low), 0.0), 1.0)
+    return below if op in ("<", "<=") else 1.0 - below
+
+
+def _selectivity(
+    stats: dict[str, Any] | None,
+    column: str,
+    condition: Any,
+    row_count: int,
+) -> float:
+    op, value = _split_condition(condition)
+    col_stats = (stats or {}).get("columns", {}).get(column)
+    if col_stats is None:
+        if op != "=":
+            return DEFAULT_RANGE_SELECTIVITY
+        if column == INDEX_COLUMN:
+            return 1 / row_count if row_count else 0.0
+        return DEFAULT_EQ_SELECTIVITY
+    if op == "=":
+        return _eq_selectivity(col_stats, stats["rows"], value)
+    return _range_selectivity(col_stats, op, value)
+
+
+def _is_index_condition(condition: Any) -> bool:
+    _, value = _split_condition(condition)
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _index_values(data: list[dict[str, Any]]) -> list[Any] | None:
+    """Return ID values if rows are stored in ID order, otherwise None."""
+    try:
+        ids = list(map(itemgetter(INDEX_COLUMN), data))
+        in_order = all(map(operator.le, ids, islice(ids, 1, None)))
+    except (KeyError, TypeError):
+        return None
+    return ids if in_order else None
+
+
+def _index_bounds(ids: list[Any], condition: Any) -> tuple[int, int]:
+    op, value = _split_condition(condition)
+    if op == "=":
+        return bisect_left(ids, value), bisect_right(ids, value)
+    if op == "<":
+        return 0, bisect_left(ids, value)
+    if op == "<=":
+        return 0, bisect_right(ids, value)
+    if op == ">":
+        return bisect_right(ids, value), len(ids)
+    return bisect_left(ids, value), len(ids)
+
+
+def plan_query(
+    metadata: dict[str, Any],
+    table_name: str,
+    where: dict[str, Any] | None,
+    data: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Choose the cheapest access path for where over loaded table rows."""
+    where = where or {}
+    stats = metadata[table_name].get("stats")
+    row_count = len(data)
+
+    candidates = [
+        {
+            "operator": "full_scan",
+            "est_scanned": float(row_count),
+            "cost": row_count * CPU_TUPLE_COST,
+            "workers": 1,
+        },
+    ]
+    index_condition = where.get(INDEX_COLUMN)
+    index_bounds = None
+    order_check = None
+    if index_condition is not None and _is_index_condition(index_condition):
+        # Файл мог быть записан не по порядку ID, тогда индекс не используется.
+        # Проверка читает ID всех записей, поэтому учитывается в стоимости.
+        start = time.monotonic()
+        ids = _index_values(data)
+        order_check = {
+            "scanned": row_count,
+            "rows": row_count,
+            "time": time.monotonic() - start,
+            "in_order": ids is not None,
+        }
+        if ids is not None:
+            index_bounds = _index_bounds(ids, index_condition)
+    if index_bounds is not None:
+        op, _ = _split_condition(index_condition)
+        low, high = index_bounds
+        candidates.append(
+            {
+                "operator": "index_lookup" if op == "=" else "range_scan",
+                "column": INDEX_COLUMN,
+                "bounds": index_bounds,
+                "est_scanned": float(high - low),
+                "cost": row_count * ORDER_CHECK_COST
+                + INDEX_STEP_COST * math.log2(row_count + 1)
+                + (high - low) * CPU_TUPLE_COST,
+                "workers": 1,
+            },
+        )
+    if where and PARALLEL_SCAN_WORKERS > 1:
+        candidates.append(
+            {
+                "operator": "parallel_scan",
+                "est_scanned": float(row_count),
+                "cost": PARALLEL_SETUP_COST
+                + row_count * CPU_TUPLE_COST / _PARALLEL_SPEEDUP,
+                "workers": PARALLEL_SCAN_WORKERS,
+            },
+        )
+
+    est_rows = float(row_count)
+    for column, condition in where.items():
+        if column == INDEX_COLUMN and index_bounds is not None:
+            low, high = index_bounds
+            est_rows *= (high - low) / row_count if row_count else 0.0
+        else:
+            est_rows *= _selectivity(stats, column, condition, row_count)
+
+    plan = min(candidates, key=lambda candidate: candidate["cost"])
+    access_column = plan.get("column")
+    plan.update(
+        {
+            "table": table_name,
+            "rows": row_count,
+            "est_rows": est_rows,
+            "condition": where.get(access_column) if access_column else None,
+            "filter": {k: v for k, v in where.items() if k != access_column},
+            "analyzed": stats is not None,
+            "order_check": order_check,
+        },
+    )
+    return plan
+
+
+def _parallel_scan(
+    data: list[dict[str, Any]],
+    where: dict[str, Any],
+    workers: int,
+) -> list[dict[str, Any]]:
+    chunk_size = max(math.ceil(len(data) / workers), 1)
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+    def scan(chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [row for row in chunk if match_where(row, where)]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(scan, chunks))
+    return [row for part in parts for row in part]
+
+
+def execute_plan(
+    plan: dict[str, Any],
+    data: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Run plan over loaded table data, return matched rows and run profile."""
+    start = time.monotonic()
+    name = plan["operator"]
+    row_filter = plan["filter"]
+    if name in ("index_lookup", "range_scan"):
+        low, high = plan["bounds"]
+        candidates = data[low:high]
+        rows = [row for row in candidates if match_where(row, row_filter)]
+        scanned = len(candidates)
+    elif name == "parallel_scan":
+        rows = _parallel_scan(data, row_filter, plan["workers"])
+        scanned = len(data)
+    elif row_filter:
+        rows = [row for row in data if match_where(row, row_filter)]
+        scanned = len(data)
+    else:
+        rows = list(data)
+        scanned = len(data)
+    profile = {
+        "scanned": scanned,
+        "rows": len(rows),
+        "time": time.monotonic() - start,
+    }
+    return rows, profile
@@ -0,0 +1,76 @@
+import pytest
+
+from src.primitive_db import core
+from src.primitive_db.parser import parse_where
+from src.primitive_db.utils import save_table_data
+
+SCHEMA = [["ID", "int"], ["name", "str"], ["age", "int"]]
+
+
+@pytest.fixture
+def metadata(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    save_table_data(
+        "users",
+        [
+            {"ID": 1, "name": "a", "age": 20},
+            {"ID": 2, "name": "b", "age": 30},
+            {"ID": 3, "name": "007", "age": 40},
+            {"ID": 4, "name": "true", "age": 50},
+        ],
+    )
+    return {"users": {"columns": SCHEMA}}
+
+
+def test_analyze_missing_table(metadata, capsys):
+    assert core.analyze(metadata, "missing") is None
+    assert "'missing'" in capsys.readouterr().out
+    assert "missing" not in metadata
+
+
+def test_explain_missing_table(metadata, capsys):
+    assert core.explain(metadata, "missing", {"ID": "1"}, analyze_run=True) is None
+    assert "'missing'" in capsys.readouterr().out
+
+
+def test_analyze_stores_stats(metadata):
+    result = core.analyze(metadata, "users")
+    assert result["users"]["stats"]["rows"] == 4
+
+
+def test_explain_analyze_reports_actual_rows(metadata):
+    report = core.explain(metadata, "users", {"age": (">", "25")}, analyze_run=True)
+    scan = report["operators"][1]
+    assert scan["scanned"] == 4
+    assert scan["rows"] == 3
+
+
+def test_where_value_converted_to_column_type(metadata):
+    report = core.explain(metadata, "users", {"age": (">", "25")})
+    assert report["plan"]["filter"] == {"age": (">", 25)}
+
+
+@pytest.mark.parametrize("tokens", [["=", "007"], ["=", '"007"']])
+def test_where_numeric_string_kept_as_text(metadata, tokens):
+    where = parse_where(["name", *tokens])
+    rows = core.select(metadata, "users", where)
+    assert [row["ID"] for row in rows] == [3]
+
+
+def test_where_bool_like_string_kept_as_text(metadata):
+    rows = core.select(metadata, "users", parse_where(["name", "=", "true"]))
+    assert [row["ID"] for row in rows] == [4]
+
+
+def test_where_value_of_wrong_type(metadata, capsys):
+    assert core.explain(metadata, "users", {"age": (">", "abc")}) is None
+    assert 'Значение "abc" не подходит для столбца age:int.' in (
+        capsys.readouterr().out
+    )
+
+
+def test_explain_analyze_reports_order_check(metadata):
+    report = core.explain(metadata, "users", {"ID": "2"}, analyze_run=True)
+    names = [op["operator"] for op in report["operators"]]
+    assert names == ["load", "order_check", report["plan"]["operator"]]
+    assert report["operators"][1]["scanned"] == 4
@@ -0,0 +1,40 @@
+import pytest
+
+from src.primitive_db.parser import parse_explain, parse_set, parse_where
+
+
+@pytest.mark.parametrize(
+    ("tokens", "expected"),
+    [
+        (["age", "=", "20"], {"age": "20"}),
+        (["age", "<", "20"], {"age": ("<", "20")}),
+        (["age", "<=", "20"], {"age": ("<=", "20")}),
+        (["age", ">", "-5"], {"age": (">", "-5")}),
+        (["age", ">=", "20"], {"age": (">=", "20")}),
+        (["name", "=", '"Bob"'], {"name": "Bob"}),
+        (["name", "=", "'007'"], {"name": "007"}),
+        (["active", "=", "true"], {"active": "true"}),
+    ],
+)
+def test_parse_where_operators(tokens, expected):
+    assert parse_where(tokens) == expected
+
+
+def test_parse_where_rejects_unknown_operator():
+    with pytest.raises(ValueError):
+        parse_where(["age", "!=", "20"])
+
+
+def test_parse_set_requires_equality():
+    with pytest.raises(ValueError):
+        parse_set(["age", ">", "20"])
+
+
+def test_parse_explain():
+    tokens = ["explain", "analyze", "select", "from", "users", "where", "ID", "=", "1"]
+    assert parse_explain(tokens) == (True, "users", {"ID": "1"})
+    assert parse_explain(["explain", "select", "from", "users"]) == (
+        False,
+        "users",
+        None,
+    )
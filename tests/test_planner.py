@@ -0,0 +1,115 @@
+import pytest
+
+from src.constants import ORDER_CHECK_COST
+from src.primitive_db.planner import (
+    collect_stats,
+    execute_plan,
+    match_where,
+    plan_query,
+)
+
+SCHEMA = [("ID", "int"), ("name", "str"), ("age", "int")]
+METADATA = {"users": {"columns": SCHEMA}}
+
+SORTED_ROWS = [
+    {"ID": i, "name": f"user{i % 7}", "age": i % 50} for i in range(1, 10001)
+]
+# ID 50000 и 1 записаны не по порядку, как после update ... set ID = ...
+UNSORTED_ROWS = (
+    [{"ID": 50000, "name": "x", "age": 1}]
+    + [{"ID": i, "name": "y", "age": i % 50} for i in range(3, 10001)]
+    + [{"ID": 1, "name": "z", "age": 2}]
+)
+
+
+@pytest.mark.parametrize("data", [SORTED_ROWS, UNSORTED_ROWS])
+@pytest.mark.parametrize(
+    "where",
+    [
+        None,
+        {"ID": 1},
+        {"ID": 50000},
+        {"ID": 5000},
+        {"ID": ("<", 3)},
+        {"ID": ("<=", 3)},
+        {"ID": (">", 9998)},
+        {"ID": (">=", 9998)},
+        {"age": 7},
+        {"age": ("<", 3)},
+        {"age": ("<=", 3)},
+        {"age": (">", 47)},
+        {"age": (">=", 47)},
+        {"ID": ("<", 500), "age": 7},
+    ],
+)
+def test_execute_plan_matches_sequential_filter(data, where):
+    plan = plan_query(METADATA, "users", where, data)
+    rows, profile = execute_plan(plan, data)
+    expected = [row for row in data if match_where(row, where or {})]
+    assert rows == expected
+    assert profile["rows"] == len(expected)
+
+
+def test_index_paths_used_for_sorted_rows():
+    assert plan_query(METADATA, "users", {"ID": 5}, SORTED_ROWS)["operator"] == (
+        "index_lookup"
+    )
+    plan = plan_query(METADATA, "users", {"ID": (">=", 9990)}, SORTED_ROWS)
+    assert plan["operator"] == "range_scan"
+    assert plan["est_scanned"] == 11
+
+
+def test_unsorted_rows_fall_back_to_full_scan():
+    plan = plan_query(METADATA, "users", {"ID": 1}, UNSORTED_ROWS)
+    assert plan["operator"] == "full_scan"
+    assert plan["order_check"]["in_order"] is False
+
+
+def test_index_cost_includes_order_check():
+    plan = plan_query(METADATA, "users", {"ID": 5}, SORTED_ROWS)
+    assert plan["order_check"]["scanned"] == len(SORTED_ROWS)
+    assert plan["cost"] >= len(SORTED_ROWS) * ORDER_CHECK_COST
+    assert plan_query(METADATA, "users", {"age": 5}, SORTED_ROWS)["order_check"] is None
+
+
+def test_collect_stats():
+    data = [
+        {"ID": 1, "name": "a", "age": 30},
+        {"ID": 2, "name": "b", "age": 30},
+        {"ID": 3, "name": "a", "age": 20},
+    ]
+    stats = collect_stats(SCHEMA, data)
+    assert stats["rows"] == 3
+    assert stats["columns"]["ID"] == {
+        "distinct": 3,
+        "min": 1,
+        "max": 3,
+        "mcv": [[1, 1], [2, 1], [3, 1]],
+    }
+    assert stats["columns"]["name"] == {
+        "distinct": 2,
+        "min": "a",
+        "max": "b",
+        "mcv": [["a", 2], ["b", 1]],
+    }
+    assert stats["columns"]["age"]["mcv"] == [[30, 2], [20, 1]]
+
+
+def test_collect_stats_empty_table():
+    stats = collect_stats(SCHEMA, [])
+    assert stats["rows"] == 0
+    assert stats["columns"]["age"] == {
+        "distinct": 0,
+        "min": None,
+        "max": None,
+        "mcv": [],
+    }
+
+
+def test_stats_drive_estimates():
+    metadata = {
+        "users": {"columns": SCHEMA, "stats": collect_stats(SCHEMA, SORTED_ROWS)},
+    }
+    plan = plan_query(metadata, "users", {"age": 7}, SORTED_ROWS)
+    assert plan["analyzed"]
+    assert plan["est_rows"] == pytest.approx(200)